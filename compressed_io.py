@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Compressed File I/O
+Streaming gzip/zstd text files for CSV exports and raw API journals
+Run directly to benchmark size ratio and read/write throughput against plain CSV
+"""
+
+import csv
+import gzip
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+try:
+    import zstandard as zstd
+except ImportError:  # optional: only needed for .zst files
+    zstd = None
+
+
+COMPRESSION_SUFFIXES = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+DEFAULT_LEVELS = {
+    "gzip": 6,
+    "zstd": 10,
+}
+
+# Valid (min, max) compression levels per codec
+LEVEL_RANGES = {
+    "gzip": (0, 9),
+    "zstd": (1, 22),
+}
+
+# Trained dictionaries are stored next to the data file as <file>.dict
+DICT_SUFFIX = ".dict"
+DICT_SIZE = 112640
+DICT_SAMPLES = 5000
+
+
+def _require_zstd():
+    if zstd is None:
+        raise RuntimeError("zstd compression requires the 'zstandard' package (pip install zstandard)")
+
+
+def zstd_available() -> bool:
+    """Whether the optional zstandard package is installed"""
+    return zstd is not None
+
+
+def compression_for(filename: str) -> Optional[str]:
+    """Infer the compression from a file name suffix (None for plain files)"""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if filename.endswith(suffix):
+            return compression
+    return None
+
+
+def with_suffix(filename: str, compression: Optional[str]) -> str:
+    """Append the suffix for `compression` to a plain file name"""
+    if not compression or compression == "none":
+        return filename
+    return filename + COMPRESSION_SUFFIXES[compression]
+
+
+def dictionary_path(filename: str) -> str:
+    """Path of the zstd dictionary sidecar for a data file"""
+    return filename + DICT_SUFFIX
+
+
+def find_existing(filename: str) -> str:
+    """Return the newest of filename, filename.zst, filename.gz that exists
+
+    Switching --compression leaves the previous export on disk, so several
+    variants can coexist; the most recently written one wins, with a warning.
+    """
+    candidates = [filename] + [filename + suffix for suffix in COMPRESSION_SUFFIXES.values()]
+    existing = [candidate for candidate in candidates if os.path.exists(candidate)]
+    if not existing:
+        return filename
+
+    newest = max(existing, key=os.path.getmtime)
+    if len(existing) > 1:
+        others = ", ".join(candidate for candidate in existing if candidate != newest)
+        print(f"Warning: using newest file {newest} (also found: {others})", file=sys.stderr)
+    return newest
+
+
+def train_zstd_dictionary(samples: List[bytes], dict_size: int = DICT_SIZE) -> Optional[bytes]:
+    """Train a zstd dictionary from sample records, None if there is too little data"""
+    _require_zstd()
+    try:
+        return zstd.train_dictionary(dict_size, samples).as_bytes()
+    except zstd.ZstdError as e:
+        print(f"Skipping zstd dictionary ({e})", file=sys.stderr)
+        return None
+
+
+def open_text(filename: str, mode: str = "r", level: Optional[int] = None,
+              zstd_dict: Optional[bytes] = None):
+    """Open a plain, gzip or zstd text file for streaming reads or writes
+
+    The compression is taken from the file suffix. For zstd, a dictionary
+    passed as `zstd_dict` is written to the .dict sidecar; on read the
+    sidecar is picked up automatically.
+    """
+    if mode not in ("r", "w"):
+        raise ValueError(f"mode must be 'r' or 'w', got {mode!r}")
+
+    compression = compression_for(filename)
+    if level is None and compression:
+        level = DEFAULT_LEVELS[compression]
+
+    if compression == "gzip":
+        return gzip.open(filename, mode + "t", compresslevel=level, encoding="utf-8", newline="")
+
+    if compression == "zstd":
+        _require_zstd()
+        sidecar = dictionary_path(filename)
+        if mode == "w":
+            if zstd_dict:
+                with open(sidecar, "wb") as f:
+                    f.write(zstd_dict)
+            elif os.path.exists(sidecar):
+                os.remove(sidecar)
+            dict_data = zstd.ZstdCompressionDict(zstd_dict) if zstd_dict else None
+            cctx = zstd.ZstdCompressor(level=level, dict_data=dict_data)
+            return io.TextIOWrapper(cctx.stream_writer(open(filename, "wb")), encoding="utf-8", newline="")
+
+        dict_data = None
+        if os.path.exists(sidecar):
+            with open(sidecar, "rb") as f:
+                dict_data = zstd.ZstdCompressionDict(f.read())
+        dctx = zstd.ZstdDecompressor(dict_data=dict_data)
+        return io.TextIOWrapper(dctx.stream_reader(open(filename, "rb")), encoding="utf-8", newline="")
+
+    return open(filename, mode, encoding="utf-8", newline="")
+
+
+def _file_size(filename: str) -> int:
+    size = os.path.getsize(filename)
+    if compression_for(filename) == "zstd" and os.path.exists(dictionary_path(filename)):
+        size += os.path.getsize(dictionary_path(filename))
+    return size
+
+
+def _sample_lines(filename: str, limit: int = DICT_SAMPLES) -> List[bytes]:
+    """Read the first `limit` lines of a text file as dictionary samples"""
+    samples = []
+    with open(filename, "rb") as f:
+        for line in f:
+            samples.append(line)
+            if len(samples) >= limit:
+                break
+    return samples
+
+
+def _valid_levels(compression: str, levels: List[int]) -> List[int]:
+    """Keep the levels that `compression` supports, noting any that are skipped"""
+    low, high = LEVEL_RANGES[compression]
+    skipped = [level for level in levels if not low <= level <= high]
+    if skipped:
+        print(f"(skipping {compression} level(s) {', '.join(map(str, skipped))}: valid range is {low}-{high})")
+    return [level for level in levels if low <= level <= high]
+
+
+def benchmark(filename: str, levels: Optional[List[int]] = None):
+    """Compare plain, gzip and zstd (with and without dictionary) for one CSV"""
+    csv.field_size_limit(2**31 - 1)
+    plain_size = os.path.getsize(filename)
+    mb = plain_size / 1e6
+
+    print("=" * 80)
+    print(f"COMPRESSION BENCHMARK: {filename} ({mb:,.1f} MB)")
+    print("=" * 80)
+
+    with open(filename, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    variants = [("plain", None, None, None)]
+    for level in _valid_levels("gzip", levels or [DEFAULT_LEVELS["gzip"]]):
+        variants.append((f"gzip-{level}", "gzip", level, None))
+    if zstd is not None:
+        zstd_dict = train_zstd_dictionary(_sample_lines(filename))
+        for level in _valid_levels("zstd", levels or [3, DEFAULT_LEVELS["zstd"], 19]):
+            variants.append((f"zstd-{level}", "zstd", level, None))
+            if zstd_dict:
+                variants.append((f"zstd-{level}+dict", "zstd", level, zstd_dict))
+    else:
+        print("(zstandard not installed: skipping zstd variants)")
+
+    print(f"\n{'variant':<16} {'size MB':>10} {'ratio':>8} {'write MB/s':>12} {'read MB/s':>12}")
+    print("-" * 62)
+
+    tmpdir = tempfile.mkdtemp(prefix="polymarket_bench_")
+    try:
+        for name, compression, level, zstd_dict in variants:
+            path = with_suffix(os.path.join(tmpdir, "data.csv"), compression)
+
+            start = time.perf_counter()
+            with open_text(path, "w", level=level, zstd_dict=zstd_dict) as f:
+                csv.writer(f).writerows(rows)
+            write_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open_text(path, "r") as f:
+                for _ in csv.reader(f):
+                    pass
+            read_s = time.perf_counter() - start
+
+            size = _file_size(path)
+            print(f"{name:<16} {size / 1e6:>10,.1f} {plain_size / size:>7.1f}x "
+                  f"{mb / write_s:>12,.1f} {mb / read_s:>12,.1f}")
+    finally:
+        shutil.rmtree(tmpdir)
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(f"Usage: {sys.argv[0]} <file.csv> [level ...]", file=sys.stderr)
+        sys.exit(1)
+    benchmark(sys.argv[1], [int(level) for level in sys.argv[2:]] or None)
@@ -5,14 +5,23 @@ Fetches ALL events from Polymarket API using async requests (active, closed, arc
 Saves events and markets data to CSV files without data loss
 """
 
+import argparse
 import asyncio
 import aiohttp
 import csv
+import io
 import json
-from typing import List, Dict, Any
+import random
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import sys
 
+from compressed_io import (
+    DEFAULT_LEVELS, DICT_SAMPLES, LEVEL_RANGES, compression_for, open_text, train_zstd_dictionary,
+    with_suffix, zstd_available
+)
+from insights_source import INSIGHTS_SOURCE_FILE, build_insights_source, save_insights_source
+
 
 BASE_URL = "https://gamma-api.polymarket.com/public-search"
 PARAMS = {
@@ -146,8 +155,21 @@ def extract_markets_data(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return markets_data
 
 
-def save_to_csv(data: List[Dict[str, Any]], filename: str):
-    """Save data to CSV file"""
+def _dictionary_samples(items: List[Any]) -> List[Any]:
+    """Pick up to DICT_SAMPLES items (deterministically) for zstd dictionary training"""
+    if len(items) <= DICT_SAMPLES:
+        return items
+    return random.Random(0).sample(items, DICT_SAMPLES)
+
+
+def save_to_csv(data: List[Dict[str, Any]], filename: str, level: Optional[int] = None,
+                train_dict: bool = False):
+    """Save data to CSV file
+
+    A .gz or .zst suffix streams the output through gzip or zstd at `level`.
+    With `train_dict`, a zstd dictionary is trained on a sample of the rows
+    and saved next to the file.
+    """
     if not data:
         print(f"No data to save to {filename}")
         return
@@ -162,7 +184,16 @@ def save_to_csv(data: List[Dict[str, Any]], filename: str):
     print(f"\nSaving {len(data)} rows to {filename}...")
     print(f"Columns: {len(fieldnames)}")
 
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+    zstd_dict = None
+    if train_dict and compression_for(filename) == "zstd":
+        records = []
+        for row in _dictionary_samples(data):
+            buffer = io.StringIO()
+            csv.DictWriter(buffer, fieldnames=fieldnames).writerow(row)
+            records.append(buffer.getvalue().encode('utf-8'))
+        zstd_dict = train_zstd_dictionary(records)
+
+    with open_text(filename, 'w', level=level, zstd_dict=zstd_dict) as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(data)
@@ -170,7 +201,55 @@ def save_to_csv(data: List[Dict[str, Any]], filename: str):
     print(f"✓ Saved to {filename}")
 
 
-async def main():
+def save_raw_journal(events: List[Dict[str, Any]], filename: str, level: Optional[int] = None,
+                     train_dict: bool = False):
+    """Save raw API events as JSON Lines (one event per line), optionally compressed"""
+    print(f"\nSaving {len(events)} raw events to {filename}...")
+
+    lines = [json.dumps(event) + "\n" for event in events]
+
+    zstd_dict = None
+    if train_dict and compression_for(filename) == "zstd":
+        zstd_dict = train_zstd_dictionary([line.encode('utf-8') for line in _dictionary_samples(lines)])
+
+    with open_text(filename, 'w', level=level, zstd_dict=zstd_dict) as f:
+        f.writelines(lines)
+
+    print(f"✓ Saved to {filename}")
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Fetch all Polymarket events and markets to CSV")
+    parser.add_argument('--compression', choices=['none', 'gzip', 'zstd'], default='none',
+                        help="compress output files (default: none)")
+    parser.add_argument('--level', type=int, default=None,
+                        help=f"compression level (gzip {LEVEL_RANGES['gzip'][0]}-{LEVEL_RANGES['gzip'][1]}, "
+                             f"default {DEFAULT_LEVELS['gzip']}; zstd {LEVEL_RANGES['zstd'][0]}-{LEVEL_RANGES['zstd'][1]}, "
+                             f"default {DEFAULT_LEVELS['zstd']})")
+    parser.add_argument('--zstd-dict', action='store_true',
+                        help="train a zstd dictionary per file (saved as <file>.dict)")
+    parser.add_argument('--raw', action='store_true',
+                        help="also save the raw API events as a JSON Lines journal")
+    args = parser.parse_args(argv)
+
+    # Validate before fetching: a bad setting would otherwise only fail when
+    # the first file is written, after the whole fetch has completed
+    if args.compression == 'zstd' and not zstd_available():
+        parser.error("--compression zstd requires the 'zstandard' package (pip install zstandard)")
+    if args.zstd_dict and args.compression != 'zstd':
+        parser.error("--zstd-dict requires --compression zstd")
+    if args.level is not None:
+        if args.compression == 'none':
+            parser.error("--level requires --compression gzip or zstd")
+        low, high = LEVEL_RANGES[args.compression]
+        if not low <= args.level <= high:
+            parser.error(f"--level for {args.compression} must be between {low} and {high}, got {args.level}")
+
+    return args
+
+
+async def main(args: argparse.Namespace):
     """Main execution function"""
     print("=" * 80)
     print("POLYMARKET DATA FETCHER")
@@ -184,15 +263,38 @@ async def main():
     events = await fetch_all_pages(max_concurrent=10)
     print(f"\n✓ Fetched {len(events)} events")
 
+    events_file = with_suffix("polymarket_events.csv", args.compression)
+    markets_file = with_suffix("polymarket_markets.csv", args.compression)
+    raw_file = with_suffix("polymarket_raw_events.jsonl", args.compression)
+
+    if args.raw:
+        save_raw_journal(events, raw_file, args.level, args.zstd_dict)
+
     # Extract and save events data
     print("\nStep 2: Extracting events data...")
     events_data = extract_events_data(events)
-    save_to_csv(events_data, "polymarket_events.csv")
+    save_to_csv(events_data, events_file, args.level, args.zstd_dict)
 
     # Extract and save markets data
     print("\nStep 3: Extracting markets data...")
     markets_data = extract_markets_data(events)
-    save_to_csv(markets_data, "polymarket_markets.csv")
+    save_to_csv(markets_data, markets_file, args.level, args.zstd_dict)
+
+    # Small sidecar so `visualize_market_data.py insights` skips the full CSVs
+    print("\nStep 4: Writing insights source...")
+    save_insights_source(build_insights_source(events_data, markets_data), INSIGHTS_SOURCE_FILE)
+
+    # Normalize outcomes/prices/token ids into NumPy arrays for analysis.
+    # numpy is optional here: without it the CSVs above are still complete.
+    print("\nStep 5: Building market outcome arrays...")
+    try:
+        from market_arrays import MARKET_ARRAYS_FILE, build_market_arrays, save_market_arrays
+    except ImportError as e:
+        arrays_file = None
+        print(f"Skipping market outcome arrays ({e}; pip install numpy to enable)")
+    else:
+        arrays_file = MARKET_ARRAYS_FILE
+        save_market_arrays(build_market_arrays(markets_data), arrays_file)
 
     # Summary
     end_time = datetime.now()
@@ -205,14 +307,19 @@ async def main():
     print(f"Total markets extracted: {len(markets_data)}")
     print(f"Time taken: {duration:.2f} seconds")
     print(f"\nFiles created:")
-    print(f"  - polymarket_events.csv ({len(events_data)} rows)")
-    print(f"  - polymarket_markets.csv ({len(markets_data)} rows)")
+    print(f"  - {events_file} ({len(events_data)} rows)")
+    print(f"  - {markets_file} ({len(markets_data)} rows)")
+    print(f"  - {INSIGHTS_SOURCE_FILE} ({len(events_data)} events)")
+    if arrays_file:
+        print(f"  - {arrays_file} ({len(markets_data)} markets)")
+    if args.raw:
+        print(f"  - {raw_file} ({len(events)} events)")
     print("=" * 80)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(parse_args()))
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
         sys.exit(1)
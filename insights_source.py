@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Insights Source
+Compact sidecar holding only what INSIGHTS.md needs (a few event columns and
+market status counts), written by the fetcher so an insights run does not
+have to parse the full events and markets CSVs
+"""
+
+import json
+from typing import Any, Dict, List
+
+
+INSIGHTS_SOURCE_FILE = "polymarket_insights_source.json"
+
+# Event columns kept per row, as the strings csv.DictWriter would write
+EVENT_COLUMNS = ['volume', 'volume24hr', 'liquidity', 'active', 'closed', 'title', 'tags', 'createdAt']
+
+
+def _cell(value: Any) -> str:
+    """Render a value the way it appears in the CSV"""
+    return "" if value is None else str(value)
+
+
+def _tag_labels(tags: Any) -> str:
+    """Reduce the JSON-encoded tags column to just the labels"""
+    if not tags:
+        return ""
+    try:
+        tag_list = json.loads(tags) if isinstance(tags, str) else tags
+        return json.dumps([{"label": tag["label"]} if "label" in tag else {} for tag in tag_list])
+    except (TypeError, ValueError):
+        return ""
+
+
+def build_insights_source(events_data: List[Dict[str, Any]],
+                          markets_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the insights source from extract_events_data()/extract_markets_data() rows"""
+    events = []
+    for row in events_data:
+        events.append([
+            _tag_labels(row.get(col)) if col == 'tags' else _cell(row.get(col))
+            for col in EVENT_COLUMNS
+        ])
+
+    return {
+        "event_columns": EVENT_COLUMNS,
+        "events": events,
+        "markets": {
+            "total": len(markets_data),
+            "active": sum(_cell(row.get('active')) == 'True' for row in markets_data),
+            "closed": sum(_cell(row.get('closed')) == 'True' for row in markets_data),
+        },
+    }
+
+
+def save_insights_source(source: Dict[str, Any], filename: str = INSIGHTS_SOURCE_FILE):
+    """Save the insights source as compact JSON"""
+    print(f"\nSaving insights source ({len(source['events'])} events) to {filename}...")
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(source, f, separators=(',', ':'))
+    print(f"✓ Saved to {filename}")
+
+
+def load_insights_source(filename: str = INSIGHTS_SOURCE_FILE) -> Dict[str, Any]:
+    """Load an insights source saved by save_insights_source()"""
+    with open(filename, encoding='utf-8') as f:
+        return json.load(f)
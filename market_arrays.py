@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Market Outcome Arrays
+Normalizes the JSON-string outcome fields of markets (outcomes, outcomePrices,
+clobTokenIds) into ragged NumPy arrays for vectorized price analysis
+"""
+
+import csv
+import json
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+from compressed_io import find_existing, open_text
+
+
+MARKET_ARRAYS_FILE = "polymarket_market_arrays.npz"
+
+TOKEN_ID_BYTES = 32
+MISSING_TOKEN_ID = b"\0" * TOKEN_ID_BYTES
+
+# Layout of the arrays dict (one entry per market unless noted):
+#   market_id      str      market id
+#   event_id       str      parent event id
+#   neg_risk       bool     market belongs to a mutually exclusive (negRisk) event
+#   offsets        int64    n_markets + 1; outcomes of market i are [offsets[i], offsets[i+1])
+#   prices         float32  one per outcome, NaN when missing
+#   outcome_codes  int32    one per outcome, index into `outcomes`
+#   outcomes       str      outcome dictionary ("Yes", "No", team names, ...)
+#   token_ids      S32      one per outcome, CLOB token id as a 256-bit big-endian
+#                           integer (all zero bytes when missing)
+ARRAY_FIELDS = ["market_id", "event_id", "neg_risk", "offsets", "prices", "outcome_codes", "outcomes", "token_ids"]
+
+
+def _parse_list(value: Any) -> List[Any]:
+    """Decode a JSON-encoded list field (the API sends these as strings)"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value) if value else []
+        except ValueError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+def _to_token_id(value: Any) -> bytes:
+    """Encode a decimal CLOB token id as 32 big-endian bytes"""
+    try:
+        return int(value).to_bytes(TOKEN_ID_BYTES, "big")
+    except (TypeError, ValueError, OverflowError):
+        return MISSING_TOKEN_ID
+
+
+def token_id_str(token_id: bytes) -> str:
+    """Decode a stored token id back to the API's decimal string ("" when missing)"""
+    # NumPy strips trailing NUL bytes from S32 items, so pad before decoding
+    token_id = bytes(token_id).ljust(TOKEN_ID_BYTES, b"\0")
+    return "" if token_id == MISSING_TOKEN_ID else str(int.from_bytes(token_id, "big"))
+
+
+def _to_bool(value: Any) -> bool:
+    """Read a flag that is a bool from the API or "True"/"False" from the CSV"""
+    return value is True or str(value).lower() == "true"
+
+
+def _to_price(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def build_market_arrays(markets: Iterable[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Build ragged outcome arrays from market rows
+
+    Accepts the rows produced by extract_markets_data() or read back from
+    polymarket_markets.csv. Markets whose outcomes and prices disagree in
+    length are padded with NaN prices / missing token ids.
+    """
+    market_ids, event_ids, neg_risk = [], [], []
+    offsets = [0]
+    prices, outcome_codes, token_ids = [], [], []
+    outcome_index: Dict[str, int] = {}
+
+    for market in markets:
+        outcomes = _parse_list(market.get("outcomes"))
+        market_prices = _parse_list(market.get("outcomePrices"))
+        market_tokens = _parse_list(market.get("clobTokenIds"))
+        count = len(outcomes) or len(market_prices)
+
+        for i in range(count):
+            label = str(outcomes[i]) if i < len(outcomes) else ""
+            if label not in outcome_index:
+                outcome_index[label] = len(outcome_index)
+            outcome_codes.append(outcome_index[label])
+            prices.append(_to_price(market_prices[i]) if i < len(market_prices) else float("nan"))
+            token_ids.append(_to_token_id(market_tokens[i]) if i < len(market_tokens) else MISSING_TOKEN_ID)
+
+        market_ids.append(str(market.get("id") or ""))
+        event_ids.append(str(market.get("event_id") or ""))
+        neg_risk.append(_to_bool(market.get("negRisk")))
+        offsets.append(offsets[-1] + count)
+
+    return {
+        "market_id": np.array(market_ids, dtype=str),
+        "event_id": np.array(event_ids, dtype=str),
+        "neg_risk": np.array(neg_risk, dtype=bool),
+        "offsets": np.array(offsets, dtype=np.int64),
+        "prices": np.array(prices, dtype=np.float32),
+        "outcome_codes": np.array(outcome_codes, dtype=np.int32),
+        "outcomes": np.array(list(outcome_index), dtype=str),
+        "token_ids": np.array(token_ids, dtype=f"S{TOKEN_ID_BYTES}"),
+    }
+
+
+def save_market_arrays(arrays: Dict[str, np.ndarray], filename: str = MARKET_ARRAYS_FILE):
+    """Save market arrays to a compressed .npz file"""
+    n_markets = len(arrays["market_id"])
+    print(f"\nSaving outcome arrays for {n_markets} markets ({len(arrays['prices'])} outcomes) to {filename}...")
+    np.savez_compressed(filename, **arrays)
+    print(f"✓ Saved to {filename}")
+
+
+def load_market_arrays(filename: str = MARKET_ARRAYS_FILE) -> Dict[str, np.ndarray]:
+    """Load market arrays saved by save_market_arrays()"""
+    with np.load(filename) as data:
+        arrays = {field: data[field] for field in ARRAY_FIELDS if field in data}
+    # Snapshots written before neg_risk was recorded: treat no event as exclusive
+    arrays.setdefault("neg_risk", np.zeros(len(arrays["market_id"]), dtype=bool))
+    return arrays
+
+
+def market_arrays_from_csv(filename: str) -> Dict[str, np.ndarray]:
+    """Build market arrays from a (possibly compressed) markets CSV"""
+    # JSON-string columns can exceed the default 128KB csv field limit
+    csv.field_size_limit(2**31 - 1)
+    with open_text(find_existing(filename)) as csvfile:
+        return build_market_arrays(csv.DictReader(csvfile))
@@ -4,104 +4,354 @@ Polymarket Data Visualization & Analysis
 Creates comprehensive charts and extracts market insights
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+# pandas, numpy, matplotlib and seaborn are imported inside the functions that
+# need them, so `insights` runs without paying for the plotting stack.
+import argparse
+import csv
 import json
-from datetime import datetime
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
 from collections import Counter
-import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (14, 8)
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['axes.labelsize'] = 11
+from compressed_io import find_existing, open_text
 
 # Output directory
 CHARTS_DIR = "charts"
 
+EVENTS_FILE = 'polymarket_events.csv'
+MARKETS_FILE = 'polymarket_markets.csv'
 
-def load_data():
-    """Load events and markets data"""
-    print("Loading data...")
-    events_df = pd.read_csv('polymarket_events.csv')
-    markets_df = pd.read_csv('polymarket_markets.csv')
+# Startup budget for `insights` runs (seconds), checked by `bench`
+STARTUP_BUDGET = 1.0
+
+_style_applied = False
+
+
+def setup_plot_style():
+    """Apply the shared seaborn/matplotlib style (once per process)"""
+    global _style_applied
+    if _style_applied:
+        return
+
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    sns.set_style("whitegrid")
+    plt.rcParams['figure.figsize'] = (14, 8)
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['axes.titlesize'] = 14
+    plt.rcParams['axes.labelsize'] = 11
+    _style_applied = True
+
+
+def load_events():
+    """Load the events data for the charts that plot it"""
+    import pandas as pd
+
+    print("Loading events data...")
+    # The newest of .csv/.csv.zst/.csv.gz is used, decompressed on the fly
+    with open_text(find_existing(EVENTS_FILE)) as f:
+        events_df = pd.read_csv(f)
 
     # Convert numeric columns
     for col in ['volume', 'volume24hr', 'volume1wk', 'volume1mo', 'liquidity', 'competitive']:
         if col in events_df.columns:
             events_df[col] = pd.to_numeric(events_df[col], errors='coerce')
 
-    for col in ['volume', 'volume24hr', 'volume1wk', 'liquidity', 'spread']:
-        if col in markets_df.columns:
-            markets_df[col] = pd.to_numeric(markets_df[col], errors='coerce')
-
     # Convert dates
     if 'createdAt' in events_df.columns:
         events_df['createdAt'] = pd.to_datetime(events_df['createdAt'], errors='coerce')
     if 'endDate' in events_df.columns:
         events_df['endDate'] = pd.to_datetime(events_df['endDate'], errors='coerce')
 
-    print(f"✓ Loaded {len(events_df):,} events and {len(markets_df):,} markets")
-    return events_df, markets_df
-
-
-def extract_insights(events_df, markets_df):
-    """Extract key insights from the data"""
+    print(f"✓ Loaded {len(events_df):,} events")
+    return events_df
+
+
+def _to_float(value):
+    """Parse a CSV cell like pd.to_numeric(errors='coerce'), None for NaN"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number
+
+
+def _to_datetime(value):
+    """Parse an ISO timestamp cell into an aware UTC datetime, None on failure"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _read_rows(filename, columns):
+    """Yield only the requested columns of each CSV row, without pandas"""
+    # JSON-string columns can exceed the default 128KB csv field limit
+    csv.field_size_limit(2**31 - 1)
+    with open_text(find_existing(filename)) as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        indexes = [header.index(col) if col in header else None for col in columns]
+        for row in reader:
+            yield [row[i] if i is not None and i < len(row) else '' for i in indexes]
+
+
+def _sidecar_is_current(sidecar, *sources):
+    """Whether `sidecar` exists and is at least as new as every source CSV
+
+    A stale sidecar (a source CSV was written after it) is reported on
+    stderr so the caller's fallback to the CSV is visible.
+    """
+    if not os.path.exists(sidecar):
+        return False
+    sidecar_mtime = os.path.getmtime(sidecar)
+    for source in sources:
+        source = find_existing(source)
+        if os.path.exists(source) and os.path.getmtime(source) > sidecar_mtime:
+            print(f"Warning: {sidecar} is older than {source}, reading {source} instead", file=sys.stderr)
+            return False
+    return True
+
+
+def _insights_rows(events_file, markets_file):
+    """Return (event_rows, (total, active, closed) market counts) for the report
+
+    Reads the fetcher's compact insights source when it is current, and
+    otherwise streams the needed columns out of the full CSVs.
+    """
+    from insights_source import EVENT_COLUMNS, INSIGHTS_SOURCE_FILE, load_insights_source
+
+    if _sidecar_is_current(INSIGHTS_SOURCE_FILE, events_file, markets_file):
+        source = load_insights_source(INSIGHTS_SOURCE_FILE)
+        if source.get('event_columns') == EVENT_COLUMNS:
+            print(f"Reading {INSIGHTS_SOURCE_FILE}...")
+            markets = source['markets']
+            return source['events'], (markets['total'], markets['active'], markets['closed'])
+
+    print(f"Reading {find_existing(events_file)} and {find_existing(markets_file)}...")
+    total_markets = active_markets = closed_markets = 0
+    for active, closed in _read_rows(markets_file, ['active', 'closed']):
+        total_markets += 1
+        active_markets += active == 'True'
+        closed_markets += closed == 'True'
+    return _read_rows(events_file, EVENT_COLUMNS), (total_markets, active_markets, closed_markets)
+
+
+def extract_insights(events_file=EVENTS_FILE, markets_file=MARKETS_FILE):
+    """Extract key insights from the data without pandas
+
+    This is the single source of the report metrics for both the `insights`
+    and chart runs, so an INSIGHTS.md refresh never imports pandas.
+    """
+    print("Extracting insights...")
     insights = {}
+    event_rows, (total_markets, active_markets, closed_markets) = _insights_rows(events_file, markets_file)
+
+    total_events = 0
+    volumes, volumes_24h, liquidities = [], [], []
+    active_events = closed_events = 0
+    top_title, top_volume = None, None
+    tag_counts = Counter()
+    created = []
+
+    for volume, volume_24h, liquidity, active, closed, title, tags, created_at in event_rows:
+        total_events += 1
+
+        volume = _to_float(volume)
+        volume_24h = _to_float(volume_24h)
+        liquidity = _to_float(liquidity)
+        if volume is not None:
+            volumes.append(volume)
+        if volume_24h is not None:
+            volumes_24h.append(volume_24h)
+            if top_volume is None or volume_24h > top_volume:
+                top_title, top_volume = title, volume_24h
+        if liquidity is not None:
+            liquidities.append(liquidity)
+
+        active_events += active == 'True'
+        closed_events += closed == 'True'
+
+        if tags:
+            try:
+                for tag in json.loads(tags):
+                    tag_counts[tag.get('label', 'Unknown')] += 1
+            except:
+                pass
+
+        created_at = _to_datetime(created_at)
+        if created_at is not None:
+            created.append(created_at)
+
+    print(f"✓ Loaded {total_events:,} events and {total_markets:,} markets")
 
     # Total metrics
-    insights['total_events'] = len(events_df)
-    insights['total_markets'] = len(markets_df)
-    insights['total_volume'] = events_df['volume'].sum()
-    insights['total_volume_24h'] = events_df['volume24hr'].sum()
-    insights['total_liquidity'] = events_df['liquidity'].sum()
+    insights['total_events'] = total_events
+    insights['total_markets'] = total_markets
+    insights['total_volume'] = sum(volumes)
+    insights['total_volume_24h'] = sum(volumes_24h)
+    insights['total_liquidity'] = sum(liquidities)
 
     # Active vs Closed
-    insights['active_events'] = (events_df['active'] == 'True').sum()
-    insights['closed_events'] = (events_df['closed'] == 'True').sum()
-    insights['active_markets'] = (markets_df['active'] == 'True').sum()
-    insights['closed_markets'] = (markets_df['closed'] == 'True').sum()
+    insights['active_events'] = active_events
+    insights['closed_events'] = closed_events
+    insights['active_markets'] = active_markets
+    insights['closed_markets'] = closed_markets
 
     # Top event
-    top_event = events_df.nlargest(1, 'volume24hr').iloc[0]
-    insights['top_event_title'] = top_event['title']
-    insights['top_event_volume'] = top_event['volume24hr']
+    insights['top_event_title'] = top_title
+    insights['top_event_volume'] = top_volume
 
     # Average metrics
-    insights['avg_markets_per_event'] = len(markets_df) / len(events_df)
-    insights['avg_event_volume'] = events_df['volume'].mean()
-    insights['avg_event_liquidity'] = events_df['liquidity'].mean()
+    nan = float('nan')
+    insights['avg_markets_per_event'] = total_markets / total_events
+    insights['avg_event_volume'] = sum(volumes) / len(volumes) if volumes else nan
+    insights['avg_event_liquidity'] = sum(liquidities) / len(liquidities) if liquidities else nan
 
     # Categories
-    tag_counts = Counter()
-    for tags in events_df['tags'].dropna():
-        try:
-            tag_list = json.loads(tags)
-            for tag in tag_list:
-                tag_counts[tag.get('label', 'Unknown')] += 1
-        except:
-            pass
     insights['top_categories'] = dict(tag_counts.most_common(10))
 
     # Time-based insights
-    events_df_with_date = events_df.dropna(subset=['createdAt'])
-    if len(events_df_with_date) > 0:
-        insights['oldest_event'] = events_df_with_date['createdAt'].min()
-        insights['newest_event'] = events_df_with_date['createdAt'].max()
-        # Make timezone-aware for comparison
-        now = pd.Timestamp.now(tz='UTC')
-        insights['events_last_30d'] = (events_df_with_date['createdAt'] >= now - pd.Timedelta(days=30)).sum()
+    if created:
+        insights['oldest_event'] = min(created)
+        insights['newest_event'] = max(created)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+        insights['events_last_30d'] = sum(1 for ts in created if ts >= cutoff)
 
     return insights
 
 
+def load_outcome_arrays(markets_file=MARKETS_FILE):
+    """Load market outcome arrays, preferring the .npz written by the fetcher"""
+    from market_arrays import MARKET_ARRAYS_FILE, load_market_arrays, market_arrays_from_csv
+
+    if _sidecar_is_current(MARKET_ARRAYS_FILE, markets_file):
+        print(f"Loading outcome arrays from {MARKET_ARRAYS_FILE}...")
+        arrays = load_market_arrays(MARKET_ARRAYS_FILE)
+    else:
+        print(f"Building outcome arrays from {find_existing(markets_file)}...")
+        arrays = market_arrays_from_csv(markets_file)
+
+    print(f"✓ Loaded {len(arrays['market_id']):,} markets with {len(arrays['prices']):,} outcomes")
+    return arrays
+
+
+def market_probability_sums(arrays):
+    """Sum of outcome prices (implied probabilities) for every market
+
+    NaN for markets with no outcomes or any missing price.
+    """
+    import numpy as np
+
+    prices = arrays['prices'].astype(np.float64)
+    offsets = arrays['offsets']
+    missing = np.isnan(prices)
+
+    # Segment sums via prefix sums, which also handles zero-outcome markets
+    price_totals = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, prices))))
+    missing_totals = np.concatenate(([0], np.cumsum(missing)))
+    sums = price_totals[offsets[1:]] - price_totals[offsets[:-1]]
+    incomplete = (missing_totals[offsets[1:]] - missing_totals[offsets[:-1]] > 0) | (offsets[1:] == offsets[:-1])
+    sums[incomplete] = np.nan
+    return sums
+
+
+def market_yes_prices(arrays):
+    """Price of the "Yes" outcome of every market, NaN for markets without one"""
+    import numpy as np
+
+    yes_prices = np.full(len(arrays['market_id']), np.nan)
+    yes_codes = np.flatnonzero(arrays['outcomes'] == 'Yes')
+    if len(yes_codes) == 0:
+        return yes_prices
+
+    offsets = arrays['offsets']
+    market_index = np.repeat(np.arange(len(yes_prices)), np.diff(offsets))
+    is_yes = arrays['outcome_codes'] == yes_codes[0]
+    yes_prices[market_index[is_yes]] = arrays['prices'][is_yes]
+    return yes_prices
+
+
+def event_probability_sums(arrays):
+    """Implied-probability sum per event, returns (event_ids, sums)
+
+    Single-market events sum all outcomes of their one market. Multi-market
+    events are only summed when every market is flagged negRisk (mutually
+    exclusive, e.g. "Who will win X?"), using each market's "Yes" price.
+    Other multi-market events (price ladders, date buckets, independent
+    questions) have no meaningful total and get NaN.
+    """
+    import numpy as np
+
+    market_sums = market_probability_sums(arrays)
+    yes_prices = market_yes_prices(arrays)
+
+    event_ids, inverse = np.unique(arrays['event_id'], return_inverse=True)
+    market_counts = np.bincount(inverse, minlength=len(event_ids))
+    neg_risk_counts = np.bincount(inverse, weights=arrays['neg_risk'], minlength=len(event_ids))
+    yes_sums = np.bincount(inverse, weights=yes_prices, minlength=len(event_ids))
+    single_sums = np.bincount(inverse, weights=market_sums, minlength=len(event_ids))
+
+    mutually_exclusive = neg_risk_counts == market_counts
+    sums = np.where(market_counts == 1, single_sums, np.where(mutually_exclusive, yes_sums, np.nan))
+    return event_ids, sums
+
+
+def overround(probability_sums):
+    """Bookmaker margin: how far implied probabilities sum above 1"""
+    return probability_sums - 1.0
+
+
+def price_deltas(old_arrays, new_arrays):
+    """Per-outcome price changes between two snapshots
+
+    Markets are matched by id; markets whose outcome count changed are
+    skipped. Returns a dict with `market_id`, `offsets` and float32 `deltas`
+    in the same ragged layout as the input arrays.
+    """
+    import numpy as np
+
+    market_ids, old_index, new_index = np.intersect1d(
+        old_arrays['market_id'], new_arrays['market_id'], return_indices=True
+    )
+    old_offsets, new_offsets = old_arrays['offsets'], new_arrays['offsets']
+    old_counts = old_offsets[1:][old_index] - old_offsets[:-1][old_index]
+    new_counts = new_offsets[1:][new_index] - new_offsets[:-1][new_index]
+
+    keep = (old_counts == new_counts) & (old_counts > 0)
+    market_ids, old_index, new_index = market_ids[keep], old_index[keep], new_index[keep]
+    counts = old_counts[keep]
+
+    # Flat outcome positions for every matched market: segment start + position within it
+    segment_starts = np.cumsum(counts) - counts
+    within = np.arange(counts.sum()) - np.repeat(segment_starts, counts)
+    old_positions = np.repeat(old_offsets[:-1][old_index], counts) + within
+    new_positions = np.repeat(new_offsets[:-1][new_index], counts) + within
+
+    return {
+        'market_id': market_ids,
+        'offsets': np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+        'deltas': new_arrays['prices'][new_positions] - old_arrays['prices'][old_positions],
+    }
+
+
 def plot_1_top_events_by_volume(events_df):
     """Top 15 Events by 24h Volume"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, ax = plt.subplots(figsize=(14, 8))
 
     top_events = events_df.nlargest(15, 'volume24hr').copy()
@@ -129,6 +379,9 @@ def plot_1_top_events_by_volume(events_df):
 
 def plot_2_category_distribution(insights):
     """Category Distribution"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, ax = plt.subplots(figsize=(14, 8))
 
     categories = insights['top_categories']
@@ -157,6 +410,8 @@ def plot_2_category_distribution(insights):
 
 def plot_3_volume_comparison(insights):
     """Volume Metrics Comparison"""
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(12, 8))
 
     metrics = {
@@ -195,6 +450,8 @@ def plot_3_volume_comparison(insights):
 
 def plot_4_market_status(insights):
     """Market Status Breakdown"""
+    import matplotlib.pyplot as plt
+
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
     # Events status
@@ -240,6 +497,9 @@ def plot_4_market_status(insights):
 
 def plot_5_volume_distribution(events_df):
     """Volume Distribution Analysis"""
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
     # Filter out zero volumes
@@ -280,6 +540,8 @@ def plot_5_volume_distribution(events_df):
 
 def plot_6_events_over_time(events_df):
     """Events Created Over Time"""
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(14, 6))
 
     events_with_date = events_df.dropna(subset=['createdAt']).copy()
@@ -309,6 +571,9 @@ def plot_6_events_over_time(events_df):
 
 def plot_7_liquidity_vs_volume(events_df):
     """Liquidity vs Volume Scatter"""
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(12, 8))
 
     # Filter for events with both metrics
@@ -343,6 +608,10 @@ def plot_7_liquidity_vs_volume(events_df):
 
 def plot_8_markets_per_event(events_df):
     """Markets per Event Distribution"""
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, ax = plt.subplots(figsize=(12, 8))
 
     market_counts = events_df['market_count'].astype(int)
@@ -433,6 +702,148 @@ def generate_insights_report(insights):
     return report
 
 
+CHARTS = {
+    'top-events': (plot_1_top_events_by_volume, 'events'),
+    'categories': (plot_2_category_distribution, 'insights'),
+    'volume-metrics': (plot_3_volume_comparison, 'insights'),
+    'market-status': (plot_4_market_status, 'insights'),
+    'volume-distribution': (plot_5_volume_distribution, 'events'),
+    'timeline': (plot_6_events_over_time, 'events'),
+    'liquidity-vs-volume': (plot_7_liquidity_vs_volume, 'events'),
+    'markets-per-event': (plot_8_markets_per_event, 'events'),
+}
+
+HEAVY_MODULES = ('pandas', 'numpy', 'matplotlib', 'seaborn')
+
+
+def save_insights_report(insights, filename='INSIGHTS.md'):
+    """Write the insights report to disk"""
+    print("\nGenerating insights report...")
+    report = generate_insights_report(insights)
+    with open(filename, 'w') as f:
+        f.write(report)
+    print(f"✓ Insights report saved to {filename}")
+
+
+def generate_charts(names, events_df, insights):
+    """Render the named charts from CHARTS"""
+    setup_plot_style()
+    print("\nGenerating visualizations...")
+    print("-" * 80)
+    for name in names:
+        plot, source = CHARTS[name]
+        plot(events_df if source == 'events' else insights)
+
+
+def run_insights(output='INSIGHTS.md'):
+    """Insights-only run: csv module only, no pandas or plotting imports"""
+    insights = extract_insights()
+    save_insights_report(insights, output)
+
+
+def _charts_need_events(names):
+    """Whether any of the named charts plots events_df (rather than insights)"""
+    return any(CHARTS[name][1] == 'events' for name in names)
+
+
+def run_charts(names):
+    """Render the given charts, loading events with pandas only if one needs it"""
+    insights = extract_insights()
+    events_df = load_events() if _charts_need_events(names) else None
+    generate_charts(names, events_df, insights)
+    print(f"\n✓ {len(names)} chart(s) saved to {CHARTS_DIR}/")
+
+
+def run_bench(budget=STARTUP_BUDGET):
+    """Measure module import time and an insights-only run against the budget
+
+    Uses `python -X importtime` to confirm that importing this module pulls in
+    none of HEAVY_MODULES, then times a full `insights` subprocess on the
+    current data. Returns a process exit code (0 when within budget).
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    ok = True
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=script_dir, capture_output=True, text=True
+    )
+    import_us = None
+    heavy = set()
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)', line)
+        if not match:
+            continue
+        package = match.group(3)
+        if package == module:
+            import_us = int(match.group(2))
+        if package.split('.')[0] in HEAVY_MODULES:
+            heavy.add(package.split('.')[0])
+
+    if import_us is None:
+        print(f"✗ Could not measure import time:\n{result.stderr}", file=sys.stderr)
+        return 1
+    print(f"Module import (cumulative): {import_us / 1e3:.1f} ms")
+    if heavy:
+        print(f"✗ Heavy modules imported at startup: {', '.join(sorted(heavy))}")
+        ok = False
+
+    if os.path.exists(find_existing(EVENTS_FILE)) and os.path.exists(find_existing(MARKETS_FILE)):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), 'insights', '--output', os.devnull],
+            capture_output=True, text=True
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            print(f"✗ insights run failed:\n{result.stderr}", file=sys.stderr)
+            return 1
+        status = '✓' if elapsed <= budget else '✗'
+        print(f"{status} insights run: {elapsed:.3f}s (budget {budget:.2f}s)")
+        ok = ok and elapsed <= budget
+    else:
+        print(f"- Skipping insights timing: {EVENTS_FILE} / {MARKETS_FILE} not found")
+
+    return 0 if ok else 1
+
+
+def run_prices(previous=None, threshold=0.05):
+    """Summarize implied probabilities, overround and (optionally) price moves"""
+    import numpy as np
+    from market_arrays import load_market_arrays
+
+    arrays = load_outcome_arrays()
+
+    market_overround = overround(market_probability_sums(arrays))
+    priced = ~np.isnan(market_overround)
+    event_ids, event_sums = event_probability_sums(arrays)
+    event_overround = overround(event_sums)
+    event_priced = ~np.isnan(event_overround)
+
+    print("\nImplied probabilities")
+    print("-" * 80)
+    print(f"Markets priced: {priced.sum():,} / {len(market_overround):,}")
+    if priced.any():
+        print(f"Median market overround: {np.median(market_overround[priced]) * 100:+.2f}%")
+    print(f"Events priced (single-market or negRisk): {event_priced.sum():,} / {len(event_ids):,}")
+    print(f"Events with |overround| > {threshold:.0%}: "
+          f"{(np.abs(event_overround[event_priced]) > threshold).sum():,}")
+
+    if previous:
+        deltas = price_deltas(load_market_arrays(previous), arrays)
+        moves = np.abs(deltas['deltas'])
+        print(f"\nPrice changes since {previous}")
+        print("-" * 80)
+        print(f"Outcomes compared: {len(moves):,} across {len(deltas['market_id']):,} markets")
+        if len(moves):
+            print(f"Mean absolute change: {np.nanmean(moves):.4f}")
+            largest = np.fmax.reduceat(moves, deltas['offsets'][:-1])
+            order = np.argsort(np.nan_to_num(largest, nan=-1.0))[::-1][:10]
+            for market_id, move in zip(deltas['market_id'][order], largest[order]):
+                print(f"  market {market_id}: {move:.3f}")
+
+
 def main():
     """Main execution"""
     print("=" * 80)
@@ -440,40 +851,64 @@ def main():
     print("=" * 80)
     print()
 
-    # Load data
-    events_df, markets_df = load_data()
-
     # Extract insights
-    print("\nExtracting insights...")
-    insights = extract_insights(events_df, markets_df)
+    insights = extract_insights()
     print("✓ Insights extracted")
 
+    # Load data
+    print()
+    events_df = load_events()
+
     # Generate all charts
-    print("\nGenerating visualizations...")
-    print("-" * 80)
-    plot_1_top_events_by_volume(events_df)
-    plot_2_category_distribution(insights)
-    plot_3_volume_comparison(insights)
-    plot_4_market_status(insights)
-    plot_5_volume_distribution(events_df)
-    plot_6_events_over_time(events_df)
-    plot_7_liquidity_vs_volume(events_df)
-    plot_8_markets_per_event(events_df)
+    generate_charts(list(CHARTS), events_df, insights)
 
     # Generate insights report
-    print("\nGenerating insights report...")
-    report = generate_insights_report(insights)
-    with open('INSIGHTS.md', 'w') as f:
-        f.write(report)
-    print("✓ Insights report saved to INSIGHTS.md")
+    save_insights_report(insights)
 
     print("\n" + "=" * 80)
     print("VISUALIZATION COMPLETE")
     print("=" * 80)
-    print(f"✓ 8 charts saved to {CHARTS_DIR}/")
+    print(f"✓ {len(CHARTS)} charts saved to {CHARTS_DIR}/")
     print("✓ Insights report saved to INSIGHTS.md")
     print("=" * 80)
 
 
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Polymarket data visualization & analysis")
+    subparsers = parser.add_subparsers(dest='command')
+
+    insights_parser = subparsers.add_parser('insights', help="write INSIGHTS.md only (no pandas/plotting)")
+    insights_parser.add_argument('--output', default='INSIGHTS.md', help="report path (default: INSIGHTS.md)")
+
+    subparsers.add_parser('charts', help="render all charts")
+
+    chart_parser = subparsers.add_parser('chart', help="render a single chart")
+    chart_parser.add_argument('name', choices=list(CHARTS))
+
+    prices_parser = subparsers.add_parser('prices', help="implied-probability sums, overround and price changes")
+    prices_parser.add_argument('--previous', help="earlier market arrays .npz to diff prices against")
+    prices_parser.add_argument('--threshold', type=float, default=0.05,
+                               help="event overround to flag (default: 0.05)")
+
+    bench_parser = subparsers.add_parser('bench', help="check startup import time and insights run time")
+    bench_parser.add_argument('--budget', type=float, default=STARTUP_BUDGET,
+                              help=f"max seconds for an insights run (default: {STARTUP_BUDGET})")
+
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.command == 'insights':
+        run_insights(args.output)
+    elif args.command == 'charts':
+        run_charts(list(CHARTS))
+    elif args.command == 'chart':
+        run_charts([args.name])
+    elif args.command == 'prices':
+        run_prices(args.previous, args.threshold)
+    elif args.command == 'bench':
+        sys.exit(run_bench(args.budget))
+    else:
+        main()